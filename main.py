@@ -1,17 +1,54 @@
 import os
+import time
+import logging
+import asyncio
+import base64
 import hashlib
-import secrets
-from datetime import datetime, timezone
+import hmac
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, List
 
-from fastapi import FastAPI, HTTPException
+import orjson
+
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from anyio import to_thread
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, OperationFailure
+from bson import ObjectId
+from bson.errors import InvalidId
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 
 from database import db, create_document, get_documents
+from schemas import MODEL_CONFIG, VerbatimStr
+
+logger = logging.getLogger(__name__)
+
+
+def _orjson_default(obj):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes bson ObjectId values as strings."""
 
-app = FastAPI()
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
 
+
+app = FastAPI(default_response_class=MongoJSONResponse)
+
+# Added first so it sits inside CORSMiddleware: preflights are answered before reaching it
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -21,44 +58,225 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+def configure_threadpool():
+    # Password hashing is offloaded to the anyio threadpool; raise its default cap of 40
+    to_thread.current_default_thread_limiter().total_tokens = 100
+
+
+# Server-side time limit for request-path reads
+QUERY_MAX_TIME_MS = 5000
+# Delay between index build attempts while Mongo is unreachable at startup
+INDEX_RETRY_DELAY = 30.0
+
+
+@app.on_event("startup")
+async def warm_up_database():
+    # Opens pooled connections so the first request doesn't pay connect + auth latency.
+    # Failure is not fatal: the app still boots and /test and /healthz report the outage.
+    if db is None:
+        return
+    try:
+        await db.command("ping")
+    except Exception as e:
+        logger.warning("MongoDB warm-up ping failed, continuing startup: %s", e)
+
+
+@app.on_event("startup")
+async def ensure_indexes():
+    # Index problems never stop the app from booting, whether Mongo is up now or only later:
+    # unreachable -> retried in the background; duplicate legacy data -> logged, index skipped
+    if db is None:
+        return
+    if not await _create_indexes():
+        logger.warning("MongoDB unreachable, retrying index creation in the background")
+        _background_tasks.add(asyncio.get_running_loop().create_task(_retry_create_indexes()))
+
+
+_background_tasks = set()
+
+async def _retry_create_indexes():
+    while True:
+        await asyncio.sleep(INDEX_RETRY_DELAY)
+        if await _create_indexes():
+            return
+        logger.warning("MongoDB still unreachable, index creation will be retried")
+
+
+# Indexes matching each endpoint's query shape; (user_id, created_at desc, _id desc) also serves the page sort
+INDEXES = {
+    "user_email": ("user", [("email", 1)], {"unique": True}),
+    "progress_user_module": ("progress", [("user_id", 1), ("module", 1)], {"unique": True}),
+    "note_user_created": ("note", [("user_id", 1), ("created_at", -1), ("_id", -1)], {}),
+    "reminder_user_created": ("reminder", [("user_id", 1), ("created_at", -1), ("_id", -1)], {}),
+}
+
+# $group keys used to list the legacy duplicates that block a unique index
+_DUPLICATE_GROUP_KEYS = {
+    "user_email": {"$toLower": "$email"},
+    "progress_user_module": {"user_id": "$user_id", "module": "$module"},
+}
+
+_DUPLICATE_FIXES = {
+    "user_email": "Lowercase all user.email values and merge or delete the duplicate accounts",
+    "progress_user_module": "Keep one progress document per (user_id, module) and delete the rest",
+}
+
+# Names of INDEXES that exist, and of those that failed for a reason a retry won't fix
+_built_indexes = set()
+_failed_indexes = set()
+
+async def _create_indexes() -> bool:
+    """Build every outstanding index independently; False if Mongo was unreachable."""
+    for name, (collection, keys, options) in INDEXES.items():
+        if name in _built_indexes or name in _failed_indexes:
+            continue
+        try:
+            await db[collection].create_index(keys, **options)
+        except ConnectionFailure as e:
+            # The remaining indexes would only wait out the same server selection timeout
+            logger.warning("Could not create index %s: %s", name, e)
+            return False
+        except OperationFailure as e:
+            _failed_indexes.add(name)
+            if e.code == 11000:
+                await _report_duplicates(name, collection)
+            else:
+                logger.error("Could not create index %s: %s", name, e)
+        else:
+            _built_indexes.add(name)
+    return True
+
+
+async def _report_duplicates(name: str, collection: str):
+    try:
+        dupes = await db[collection].aggregate([
+            {"$group": {"_id": _DUPLICATE_GROUP_KEYS[name], "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$limit": 20},
+        ]).to_list(length=20)
+        examples = ", ".join(str(d["_id"]) for d in dupes) or "(none found)"
+    except Exception as e:
+        examples = f"(lookup failed: {e})"
+    logger.error(
+        "Cannot create unique index %s on %s: duplicate documents exist for %s. %s, then restart. "
+        "Running without this index until then.",
+        name, collection, examples, _DUPLICATE_FIXES[name],
+    )
+
+
 # Utilities
-SALT_LEN = 16
+# Argon2id; the salt and parameters are embedded in the encoded hash string
+PH = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=1)
 
-def hash_password(password: str, salt: Optional[str] = None) -> str:
-    salt = salt or secrets.token_hex(SALT_LEN)
-    h = hashlib.sha256((salt + password).encode()).hexdigest()
-    return f"{salt}${h}"
+def hash_password(password: str) -> str:
+    return PH.hash(password)
 
-def verify_password(password: str, stored: str) -> bool:
+def is_legacy_hash(stored: str) -> bool:
+    # Pre-argon2 hashes were stored as "<salt>$<sha256 hex>"
+    return not stored.startswith("$argon2")
+
+def _verify_legacy_password(password: str, stored: str) -> bool:
     try:
-        salt, _hash = stored.split("$")
+        salt, expected = stored.split("$")
     except ValueError:
         return False
-    return hash_password(password, salt) == stored
+    actual = hashlib.sha256((salt + password).encode()).hexdigest()
+    return hmac.compare_digest(actual, expected)
+
+def verify_password(password: str, stored: str) -> bool:
+    if is_legacy_hash(stored):
+        return _verify_legacy_password(password, stored)
+    try:
+        # Constant-time comparison happens inside argon2
+        return PH.verify(stored, password)
+    except (VerificationError, InvalidHashError):
+        # VerificationError covers VerifyMismatchError
+        return False
+
+def needs_rehash(stored: str) -> bool:
+    # Legacy hashes are upgraded to argon2id on the next successful login
+    return is_legacy_hash(stored) or PH.check_needs_rehash(stored)
+
+# Login tokens are sliced from a buffered os.urandom pool instead of one syscall per token
+_RNG_POOL = bytearray()
+_RNG_LOCK = threading.Lock()
+_RNG_REFILL = 4096
+# A forked worker must never hand out bytes already buffered by its parent
+os.register_at_fork(after_in_child=_RNG_POOL.clear)
+
+def token_urlsafe_fast(nbytes: int = 24) -> str:
+    with _RNG_LOCK:
+        if len(_RNG_POOL) < nbytes:
+            _RNG_POOL.extend(os.urandom(_RNG_REFILL))
+        out = bytes(_RNG_POOL[:nbytes])
+        del _RNG_POOL[:nbytes]
+    return base64.urlsafe_b64encode(out).rstrip(b"=").decode("ascii")
 
 
 # Schemas for requests
+# Normalization lives in model config/validators so it runs once, inside pydantic-core
+
+@lru_cache(maxsize=4096)
+def _norm_email(email: str) -> str:
+    # Repeat logins for the same address (e.g. credential stuffing) hit the cache
+    return email.strip().lower()
+
 class SignupRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str
     email: EmailStr
-    password: str
+    password: VerbatimStr
+
+    @field_validator("email")
+    @classmethod
+    def _lower_email(cls, v: str) -> str:
+        return _norm_email(v)
 
 class LoginRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
     email: EmailStr
-    password: str
+    password: VerbatimStr
+
+    @field_validator("email")
+    @classmethod
+    def _lower_email(cls, v: str) -> str:
+        return _norm_email(v)
 
 class ProgressRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
     module: str
     done: bool
 
+MAX_BULK_PROGRESS_ITEMS = 500
+
+class ProgressItem(BaseModel):
+    model_config = MODEL_CONFIG
+
+    module: str
+    done: bool
+
+class BulkProgressRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
+    user_id: str
+    items: List[ProgressItem] = Field(..., max_length=MAX_BULK_PROGRESS_ITEMS)
+
 class NoteRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
-    content: str
+    content: VerbatimStr
 
 class ReminderRequest(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
-    text: str
+    text: VerbatimStr
     time: str  # HH:MM
 
 
@@ -67,8 +285,27 @@ def read_root():
     return {"message": "Getteng Apps Backend Running"}
 
 
+@app.get("/healthz")
+async def healthz():
+    # Cheap liveness probe: a single ping with a short timeout
+    if db is None:
+        return MongoJSONResponse({"status": "error", "database": "not configured"}, status_code=503)
+    try:
+        await asyncio.wait_for(db.command("ping"), timeout=1.0)
+    except Exception:
+        return MongoJSONResponse({"status": "error", "database": "unreachable"}, status_code=503)
+    return {"status": "ok"}
+
+
+# Last successful /test diagnostic, served for TEST_CACHE_TTL seconds (and when Mongo errors)
+TEST_CACHE_TTL = 30.0
+_test_cache = {"t": 0.0, "payload": None}
+
 @app.get("/test")
-def test_database():
+async def test_database():
+    if _test_cache["payload"] is not None and time.monotonic() - _test_cache["t"] < TEST_CACHE_TTL:
+        return _test_cache["payload"]
+    ok = False
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -84,44 +321,69 @@ def test_database():
             response["database_name"] = getattr(db, "name", None) or "✅ Connected"
             response["connection_status"] = "Connected"
             try:
-                response["collections"] = db.list_collection_names()
+                response["collections"] = await db.list_collection_names()
                 response["database"] = "✅ Connected & Working"
+                ok = True
             except Exception as e:
                 response["database"] = f"⚠️ Connected but Error: {str(e)[:80]}"
     except Exception as e:
         response["database"] = f"❌ Error: {str(e)[:80]}"
+    if ok:
+        _test_cache["t"] = time.monotonic()
+        _test_cache["payload"] = response
+    elif _test_cache["payload"] is not None:
+        # Serve the stale diagnostic rather than the error while Mongo is failing
+        return _test_cache["payload"]
     return response
 
 
 # Auth endpoints (simple token-less demo)
+async def _is_only_account(users, email: str, inserted_id) -> bool:
+    # Without the unique index, back the insert out if any other account has this email.
+    # Of two racing signups the second check always sees both inserts, so duplicates never
+    # survive; at worst both back out and the user retries.
+    if await users.count_documents({"email": email}, limit=2) > 1:
+        await users.delete_one({"_id": inserted_id})
+        return False
+    return True
+
+
 @app.post("/auth/signup")
-def signup(req: SignupRequest):
+async def signup(req: SignupRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
     users = db["user"]
-    if users.find_one({"email": req.email}):
-        raise HTTPException(status_code=400, detail="Email already registered")
-    doc = {
-        "name": req.name.strip(),
-        "email": req.email.lower(),
-        "password_hash": hash_password(req.password),
-        "created_at": datetime.now(timezone.utc),
-        "updated_at": datetime.now(timezone.utc),
+    now = datetime.now(timezone.utc)
+    doc = req.model_dump(exclude={"password"}) | {
+        "password_hash": await run_in_threadpool(hash_password, req.password),
+        "created_at": now,
+        "updated_at": now,
     }
-    res = users.insert_one(doc)
+    try:
+        # The unique email index rejects duplicates atomically, without a separate lookup
+        res = await users.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    if "user_email" not in _built_indexes and not await _is_only_account(users, doc["email"], res.inserted_id):
+        raise HTTPException(status_code=400, detail="Email already registered")
     return {"user_id": str(res.inserted_id), "name": doc["name"], "email": doc["email"]}
 
 
 @app.post("/auth/login")
-def login(req: LoginRequest):
+async def login(req: LoginRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
     users = db["user"]
-    user = users.find_one({"email": req.email.lower()})
-    if not user or not verify_password(req.password, user.get("password_hash", "")):
+    user = await users.find_one({"email": req.email}, max_time_ms=QUERY_MAX_TIME_MS)
+    if not user or not await run_in_threadpool(verify_password, req.password, user.get("password_hash", "")):
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if needs_rehash(user["password_hash"]):
+        await users.update_one(
+            {"_id": user["_id"]},
+            {"$set": {"password_hash": await run_in_threadpool(hash_password, req.password), "updated_at": datetime.now(timezone.utc)}},
+        )
     # For simplicity, return a pseudo token (not JWT)
-    token = secrets.token_urlsafe(24)
+    token = token_urlsafe_fast(24)
     return {"token": token, "user": {"id": str(user["_id"]), "name": user["name"], "email": user["email"]}}
 
 
@@ -171,76 +433,195 @@ COURSES = [
     },
 ]
 
+# COURSES never changes at runtime, so serialize it once
+_COURSES_JSON = orjson.dumps({"items": COURSES})
+# Weak, because GZipMiddleware serves gzip and identity bodies under the same ETag
+_COURSES_ETAG = f'W/"{hashlib.md5(_COURSES_JSON).hexdigest()}"'
+_COURSES_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _COURSES_ETAG}
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match uses weak comparison: W/ prefixes are ignored and * matches anything
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
 @app.get("/courses")
-def list_courses():
-    return {"items": COURSES}
+async def list_courses(if_none_match: Optional[str] = Header(None)):
+    if if_none_match and _etag_matches(if_none_match, _COURSES_ETAG):
+        return Response(status_code=304, headers=_COURSES_HEADERS)
+    return Response(content=_COURSES_JSON, media_type="application/json", headers=_COURSES_HEADERS)
+
+
+# Documents fetched per cursor round-trip when streaming list responses
+STREAM_BATCH_SIZE = 200
+
+# Fields returned by the list endpoints; the server renders _id as a string "id" field
+_ID_AS_STR = {"_id": 0, "id": {"$toString": "$_id"}}
+PROGRESS_PROJECTION = {**_ID_AS_STR, "user_id": 1, "module": 1, "done": 1, "updated_at": 1}
+NOTE_PROJECTION = {**_ID_AS_STR, "content": 1, "created_at": 1}
+REMINDER_PROJECTION = {**_ID_AS_STR, "text": 1, "time": 1, "created_at": 1}
+
+
+# Keyset pagination for notes/reminders. The cursor is "<created_at epoch ms>_<id>" so that
+# items sharing a timestamp are still ordered (and paged) deterministically by _id.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+PAGE_SORT = [("created_at", -1), ("_id", -1)]
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _encode_page_cursor(doc: dict) -> str:
+    created_at = doc["created_at"]
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    ms = (created_at - _EPOCH) // timedelta(milliseconds=1)
+    return f"{ms}_{doc['id']}"
+
+def _decode_page_cursor(cursor: str):
+    try:
+        ms, oid = cursor.split("_")
+        return _EPOCH + timedelta(milliseconds=int(ms)), ObjectId(oid)
+    except (ValueError, OverflowError, InvalidId):
+        # OverflowError: ms outside the range a datetime can represent
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def _page_query(user_id: str, cursor: Optional[str]) -> dict:
+    query = {"user_id": user_id}
+    if cursor is not None:
+        created_at, oid = _decode_page_cursor(cursor)
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "_id": {"$lt": oid}},
+        ]
+    return query
+
+
+async def _stream_items(first, cursor, page_size: Optional[int]):
+    # Emits {"items": [...]} one document at a time so memory stays O(batch size).
+    # Paged lists also get "next_cursor" once the last item is known.
+    yield b'{"items":['
+    last, count = first, 0
+    if first is not None:
+        count = 1
+        yield orjson.dumps(first, default=_orjson_default)
+        async for doc in cursor:
+            last = doc
+            count += 1
+            yield b","
+            yield orjson.dumps(doc, default=_orjson_default)
+    if page_size is None:
+        yield b"]}"
+        return
+    next_cursor = _encode_page_cursor(last) if last is not None and count >= page_size else None
+    yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+
+async def stream_items_response(cursor, page_size: Optional[int] = None) -> StreamingResponse:
+    # The first batch is fetched before any headers go out, so query errors still surface as a 500
+    cursor = cursor.batch_size(STREAM_BATCH_SIZE).max_time_ms(QUERY_MAX_TIME_MS)
+    try:
+        first = await cursor.next()
+    except StopAsyncIteration:
+        first = None
+    return StreamingResponse(_stream_items(first, cursor, page_size), media_type="application/json")
 
 
 # Study progress
+def _progress_upsert(user_id: str, module: str, done: bool, now: datetime):
+    query = {"user_id": user_id, "module": module}
+    update = {"$set": {"done": done, "updated_at": now}, "$setOnInsert": {"created_at": now}}
+    return query, update
+
+
 @app.get("/progress")
-def get_progress(user_id: str):
+async def get_progress(user_id: str):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    items = list(db["progress"].find({"user_id": user_id}))
-    for it in items:
-        it["id"] = str(it.pop("_id"))
-    return {"items": items}
+    cursor = db["progress"].find({"user_id": user_id}, PROGRESS_PROJECTION)
+    return await stream_items_response(cursor)
 
 
 @app.post("/progress")
-def upsert_progress(req: ProgressRequest):
+async def upsert_progress(req: ProgressRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
     col = db["progress"]
-    col.update_one(
-        {"user_id": req.user_id, "module": req.module},
-        {"$set": {"done": req.done, "updated_at": datetime.now(timezone.utc)}, "$setOnInsert": {"created_at": datetime.now(timezone.utc)}},
-        upsert=True,
-    )
+    query, update = _progress_upsert(req.user_id, req.module, req.done, datetime.now(timezone.utc))
+    try:
+        await col.update_one(query, update, upsert=True)
+    except DuplicateKeyError:
+        # A concurrent upsert inserted the same (user_id, module) first; the retry matches it
+        await col.update_one(query, update, upsert=True)
     return {"status": "ok"}
 
 
+@app.post("/progress/bulk")
+async def bulk_upsert_progress(req: BulkProgressRequest):
+    if db is None:
+        raise HTTPException(status_code=500, detail="Database not configured")
+    if not req.items:
+        return {"status": "ok", "count": 0}
+    col = db["progress"]
+    now = datetime.now(timezone.utc)
+    ops = [UpdateOne(*_progress_upsert(req.user_id, it.module, it.done, now), upsert=True) for it in req.items]
+    try:
+        await col.bulk_write(ops, ordered=False)
+    except BulkWriteError as e:
+        # Retry only the upserts that lost a duplicate-key race; anything else is a real failure
+        errors = e.details.get("writeErrors", [])
+        if e.details.get("writeConcernErrors") or not errors or any(err.get("code") != 11000 for err in errors):
+            raise
+        await col.bulk_write([ops[err["index"]] for err in errors], ordered=False)
+    return {"status": "ok", "count": len(ops)}
+
+
 # Notes
 @app.get("/notes")
-def get_notes(user_id: str):
+async def get_notes(user_id: str, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    items = list(db["note"].find({"user_id": user_id}).sort("created_at", -1))
-    for it in items:
-        it["id"] = str(it.pop("_id"))
-    return {"items": items}
+    results = db["note"].find(_page_query(user_id, cursor), NOTE_PROJECTION).sort(PAGE_SORT).limit(limit)
+    return await stream_items_response(results, page_size=limit)
 
 
 @app.post("/notes")
-def add_note(req: NoteRequest):
+async def add_note(req: NoteRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    doc = {"user_id": req.user_id, "content": req.content, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}
-    res = db["note"].insert_one(doc)
+    now = datetime.now(timezone.utc)
+    doc = {"user_id": req.user_id, "content": req.content, "created_at": now, "updated_at": now}
+    res = await db["note"].insert_one(doc)
     return {"id": str(res.inserted_id)}
 
 
 # Reminders
 @app.get("/reminders")
-def get_reminders(user_id: str):
+async def get_reminders(user_id: str, limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE), cursor: Optional[str] = None):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    items = list(db["reminder"].find({"user_id": user_id}).sort("created_at", -1))
-    for it in items:
-        it["id"] = str(it.pop("_id"))
-    return {"items": items}
+    results = db["reminder"].find(_page_query(user_id, cursor), REMINDER_PROJECTION).sort(PAGE_SORT).limit(limit)
+    return await stream_items_response(results, page_size=limit)
 
 
 @app.post("/reminders")
-def add_reminder(req: ReminderRequest):
+async def add_reminder(req: ReminderRequest):
     if db is None:
         raise HTTPException(status_code=500, detail="Database not configured")
-    doc = {"user_id": req.user_id, "text": req.text, "time": req.time, "created_at": datetime.now(timezone.utc), "updated_at": datetime.now(timezone.utc)}
-    res = db["reminder"].insert_one(doc)
+    now = datetime.now(timezone.utc)
+    doc = {"user_id": req.user_id, "text": req.text, "time": req.time, "created_at": now, "updated_at": now}
+    res = await db["reminder"].insert_one(doc)
     return {"id": str(res.inserted_id)}
 
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
@@ -1,18 +1,28 @@
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, EmailStr, StringConstraints
+from typing import Annotated, Optional, List
 from datetime import datetime
 
 # Each model corresponds to a MongoDB collection named by the lowercase class name
 # Example: class User -> collection "user"
 
+# Shared by these models and the request models in main.py
+MODEL_CONFIG = ConfigDict(str_strip_whitespace=True, extra="ignore", populate_by_name=True)
+
+# Text kept exactly as written (passwords, note bodies, reminder text); opts out of stripping
+VerbatimStr = Annotated[str, StringConstraints(strip_whitespace=False)]
+
 class User(BaseModel):
+    model_config = MODEL_CONFIG
+
     name: str = Field(..., min_length=2, max_length=80)
     email: EmailStr
-    password_hash: str = Field(..., description="Hashed password with salt")
+    password_hash: str = Field(..., description="Argon2id encoded password hash")
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 class Course(BaseModel):
+    model_config = MODEL_CONFIG
+
     slug: str = Field(..., min_length=2)
     title: str
     duration: str
@@ -22,6 +32,8 @@ class Course(BaseModel):
     updated_at: Optional[datetime] = None
 
 class Progress(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
     module: str
     done: bool = False
@@ -29,14 +41,18 @@ class Progress(BaseModel):
     updated_at: Optional[datetime] = None
 
 class Note(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
-    content: str
+    content: VerbatimStr
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 class Reminder(BaseModel):
+    model_config = MODEL_CONFIG
+
     user_id: str
-    text: str
+    text: VerbatimStr
     time: str  # HH:MM
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None